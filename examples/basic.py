@@ -3,20 +3,17 @@ import asyncio
 import argparse
 import logging
 
-from pysk8 import setCoreLogLevel
+from pysk8 import run, setCoreLogLevel
 from pysk8.core import SK8
+from pysk8.runner import run_commands
 
-async def basic(device_name: str) -> None:
-    async with SK8() as sk8: # this will disconnect any active connections when it goes out of scope
+logger = logging.getLogger('pysk8.examples')
 
-        # attempt to connect to the named device, with a scan timeout of 3s
-        if not await sk8.connect(device_name):
-            print(f'Failed to connect to device {device_name}')
-            sys.exit(-1)
-
-        # Get the name and firmware version
-        print('Device name={}, firmware={}'.format(await sk8.get_device_name(), await sk8.get_firmware_version()))
-        print('Battery level: {}%'.format(await sk8.get_battery_level()))
+async def basic(sk8: SK8) -> None:
+    # Get the name, firmware version and battery level in one go
+    info = await sk8.get_device_info()
+    logger.info('Device name=%s, firmware=%s', info.name, info.firmware_version)
+    logger.info('Battery level: %d%%', info.battery_level)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -24,8 +21,13 @@ if __name__ == "__main__":
     parser.add_argument('-D', '--show_logs', help='Show DEBUG level log messages', action='store_true')
     args = parser.parse_args()
 
-    # show full logging output from pysk8
+    # output from this script goes through logging at INFO level. -D shows 
+    # full logging output from pysk8 as well
+    logging.basicConfig(stream=sys.stdout, level=logging.DEBUG if args.show_logs else logging.INFO)
     if args.show_logs:
         setCoreLogLevel(logging.DEBUG)
 
-    asyncio.run(basic(args.device_name))
+    # attempt to connect to the named device, with a scan timeout of 3s
+    if not run(run_commands(args.device_name, [basic])):
+        logger.error('Failed to connect to device %s', args.device_name)
+        sys.exit(-1)
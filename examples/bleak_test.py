@@ -1,34 +1,69 @@
 import asyncio 
 import sys
-import os
+import argparse
+import logging
+from collections import deque
 from typing import Sequence, Any
 
-sys.path.append(os.path.split(os.path.dirname(__file__))[0])
+from pysk8 import run
 from pysk8.core import SK8
 
-def test_imu(acc: Sequence[float], gyro: Sequence[float], mag: Sequence[float], imu_index: int, seq: int, timestamp: float, _: Any):
-    print(acc, gyro, mag, imu_index, seq, timestamp)
+logger = logging.getLogger('pysk8.examples')
 
-async def main(device_name: str) -> None:
+# maximum number of batches to keep
+MAX_BATCHES = 8192
+
+def test_imu(acc: Sequence[Sequence[int]], gyro: Sequence[Sequence[int]], mag: Sequence[Sequence[int]], 
+             imu_index: Sequence[int], seq: Sequence[int], timestamp: Sequence[float], count: int, batches: deque):
+    # called once per batch of packets rather than once per packet. printing 
+    # from here can hold up delivery of the next packets, so just store the 
+    # data and write it out once streaming has stopped
+    batches.append((acc, gyro, mag, imu_index, seq, timestamp))
+
+async def main(device_name: str, duration: float, polling_override: int) -> None:
     
     async with SK8() as sk8:
-        await sk8.connect(device_name)
+        await sk8.connect(device_name, low_latency=True)
 
-        print('Device info')
-        print('Battery', await sk8.get_battery_level())
-        print('Name', await sk8.get_device_name())
-        print('FW', await sk8.get_firmware_version())
+        info = await sk8.get_device_info()
+        logger.info('Device info')
+        logger.info('Battery %d', info.battery_level)
+        logger.info('Name %s', info.name)
+        logger.info('FW %s', info.firmware_version)
 
         # await sk8.pp_services()
 
-        sk8.set_imu_callback(test_imu)
-        await sk8.enable_imu_streaming([0])
+        if polling_override > 0:
+            await sk8.set_polling_override(polling_override)
+
+        batches = deque(maxlen=MAX_BATCHES)
+        sk8.set_imu_batch_callback(test_imu, batches)
+        await sk8.enable_imu_streaming([0], batched=True)
 
-        await asyncio.sleep(10)
+        stop = asyncio.Event()
+        asyncio.get_running_loop().call_later(duration, stop.set)
+        await stop.wait()
 
         await sk8.disable_imu_streaming()
+
+        # write everything out in one go rather than a line at a time
+        lines = []
+        for acc, gyro, mag, imu_index, seq, timestamp in batches:
+            for sample in zip(zip(*acc, strict=True), zip(*gyro, strict=True), zip(*mag, strict=True), 
+                              imu_index, seq, timestamp, strict=True):
+                lines.append('{} {} {} {} {} {}\n'.format(*sample))
+        sys.stdout.write(''.join(lines))
+        logger.info('%d samples received in %d batches', len(lines), len(batches))
     
 
 if __name__ == "__main__":
-    asyncio.run(main(sys.argv[1]))
+    parser = argparse.ArgumentParser()
+    parser.add_argument('device_name', help='SK8 device to connect to', type=str)
+    parser.add_argument('-d', '--duration', help='Time to stream IMU data for (seconds)', type=float, default=10.0)
+    parser.add_argument('-p', '--polling_override', type=int, default=0, 
+                        help='Sensor polling period override (ms, minimum 20, 0 = firmware default)')
+    args = parser.parse_args()
+
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+    run(main(args.device_name, args.duration, args.polling_override))
 
@@ -1,37 +1,73 @@
 import sys 
 import asyncio
+import signal
 import time
 import logging
 import argparse
+from functools import partial
+from typing import Any
 
-from pysk8 import setCoreLogLevel
+from pysk8 import run, setCoreLogLevel
 from pysk8.core import SK8
+from pysk8.runner import run_commands
 
-async def hardware(device_name: str) -> None:
-    async with SK8() as sk8: # this will disconnect any active connections when it goes out of scope
+logger = logging.getLogger('pysk8.examples')
 
-        # attempt to connect to the named device, with a scan timeout of 3s
-        if not await sk8.connect(device_name):
-            print(f'Failed to connect to device {device_name}')
-            sys.exit(-1)
+async def hardware(sk8: SK8, poll_interval: float) -> None:
+    stop = asyncio.Event()
+    wake = asyncio.Event()
 
-        while True:
+    def on_change(hardware: int, _: Any) -> None:
+        wake.set()
+
+    def on_interrupt() -> None:
+        stop.set()
+        wake.set()
+
+    # stop cleanly on Ctrl-C (not supported on Windows, where this will 
+    # cancel the task instead)
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, on_interrupt)
+        signal_handler = True
+    except NotImplementedError:
+        signal_handler = False
+
+    # if the firmware can notify us when the hardware changes, wait for that to 
+    # happen instead of repeatedly polling the device
+    notify = await sk8.enable_hardware_notifications(on_change)
+    cached = False
+    try:
+        while not stop.is_set():
+            # show if the SK8 has external IMUs or ExtAna board connected
+            logger.info('Has IMUs: %s | Has ExtAna: %s', await sk8.has_imus(cached), await sk8.has_extana(True))
             try:
-                # show if the SK8 has external IMUs or ExtAna board connected
-                print('Has IMUs: {} | Has ExtAna: {}'.format(await sk8.has_imus(False), await sk8.has_extana(True)))
-                await asyncio.sleep(0.5)
-            except asyncio.exceptions.CancelledError:
-                print('Disconnecting...')
-                break
+                await asyncio.wait_for(wake.wait(), timeout=None if notify else poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            wake.clear()
+            cached = notify
+    finally:
+        if signal_handler:
+            loop.remove_signal_handler(signal.SIGINT)
+
+    logger.info('Disconnecting...')
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument('device_name', help='SK8 device to connect to', type=str)
+    parser.add_argument('-i', '--poll_interval', type=float, default=5.0, 
+                        help='Polling interval (seconds) if hardware notifications are unavailable')
     parser.add_argument('-D', '--show_logs', help='Show DEBUG level log messages', action='store_true')
     args = parser.parse_args()
 
-    # show full logging output from pysk8
+    # output from this script goes through logging at INFO level. -D shows 
+    # full logging output from pysk8 as well
+    logging.basicConfig(stream=sys.stdout, level=logging.DEBUG if args.show_logs else logging.INFO)
     if args.show_logs:
         setCoreLogLevel(logging.DEBUG)
 
-    asyncio.run(hardware(args.device_name))
+    # attempt to connect to the named device, with a scan timeout of 3s
+    if not run(run_commands(args.device_name, [partial(hardware, poll_interval=args.poll_interval)])):
+        logger.error('Failed to connect to device %s', args.device_name)
+        sys.exit(-1)
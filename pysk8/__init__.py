@@ -1,13 +1,19 @@
+import asyncio
+import atexit
 import logging
-import sys
+from typing import Any, Callable, Coroutine, Optional, TypeVar
 
 from . import core
 
-logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+# leave log output configuration to the application
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 def setCoreLogLevel(lvl: int) -> None:
     """
     Shortcut method to set pysk8.core loglevel
+
+    Note that pysk8 doesn't configure any log handlers itself, so to see the
+    output the application must also do so (e.g. with `logging.basicConfig`).
     
     Args: 
         lvl (int): a standard level enum from the logging module
@@ -16,3 +22,49 @@ def setCoreLogLevel(lvl: int) -> None:
         nothing
     """
     core.logger.setLevel(lvl)    
+
+T = TypeVar('T')
+
+# asyncio.Runner is new in Python 3.11, so on older versions a single event 
+# loop is managed directly instead
+_runner: 'Optional[asyncio.Runner]' = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    try:
+        import uvloop # type: ignore
+        return uvloop.new_event_loop
+    except ImportError:
+        return None
+
+def _close_loop() -> None:
+    if _loop is not None and not _loop.is_closed():
+        _loop.run_until_complete(_loop.shutdown_asyncgens())
+        _loop.close()
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, like `asyncio.run`.
+
+    Unlike `asyncio.run`, the event loop is created once and then reused for 
+    every call in the same process, rather than being set up and torn down 
+    each time. If uvloop is installed, it is used as the loop implementation. 
+
+    Args:
+        coro: the coroutine to run
+
+    Returns:
+        the return value of the coroutine
+    """
+    global _runner, _loop
+    if hasattr(asyncio, 'Runner'):
+        if _runner is None:
+            _runner = asyncio.Runner(loop_factory=_loop_factory())
+            atexit.register(_runner.close)
+        return _runner.run(coro)
+
+    if _loop is None:
+        _loop = (_loop_factory() or asyncio.new_event_loop)()
+        asyncio.set_event_loop(_loop)
+        atexit.register(_close_loop)
+    return _loop.run_until_complete(coro)
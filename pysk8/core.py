@@ -1,10 +1,15 @@
 import asyncio
-import time
+import functools
 import logging
 import os
 import struct
+import threading
+from array import array
+from collections import deque
 from configparser import ConfigParser
-from typing import Any, Callable, List, Optional, Tuple, Sequence, Union
+from dataclasses import dataclass
+from time import time as _time
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, Sequence, TypeVar, Union
 
 import bleak
 from bleak import BleakClient, BleakScanner, BLEDevice, BleakGATTCharacteristic
@@ -43,36 +48,257 @@ logger.setLevel(logging.INFO)
 # bleak seems to log at DEBUG level by default which is very verbose
 bleak_logger = logging.getLogger('bleak').setLevel(logging.WARN)
 
+T = TypeVar('T')
+
+# pre-bound packet decoders for the notification handlers
+_UNPACK_IMU = IMU_DATA_STRUCT.unpack_from
+_UNPACK_EXTANA = EXTANA_DATA_STRUCT.unpack_from
+_ITER_UNPACK_IMU = IMU_DATA_STRUCT.iter_unpack
+# array typecodes matching each field of IMU_DATA_STRUCT, for batched IMU data
+_IMU_FIELD_TYPECODES = ('h',) * 9 + ('B', 'B')
+
+# packs a single unsigned byte, for the various config characteristics
+_U8 = struct.Struct('B').pack
+
+# packing and scaling for the ExtAna LED, which uses a 0-3000 range internally
+_LED_STRUCT = struct.Struct('<HHH')
+_LED_TO_INT_SCALE = INT_LED_MAX / LED_MAX
+_LED_FROM_INT_SCALE = LED_MAX / INT_LED_MAX
+
+@functools.lru_cache(maxsize=256)
+def _normalize_uuid(uuid: str) -> str:
+    # the set of UUIDs used is small and fixed, so only normalise each one once
+    return bleak.uuids.normalize_uuid_str(uuid)
+
+# devices found by previous scans, keyed by both name and address, so that 
+# reconnecting to the same SK8 from this process doesn't need another scan
+_device_cache: dict[str, BLEDevice] = {}
+
+# parsed calibration files, keyed by path along with the file modification time, 
+# so a file is only parsed again if it has changed
+_calibration_cache: dict[str, Tuple[int, ConfigParser]] = {}
+
+def clear_calibration_cache() -> None:
+    """
+    Discard all cached calibration data.
+
+    Calibration files are only parsed again when they are modified, so this
+    is only needed to release the memory they use.
+    """
+    _calibration_cache.clear()
+
+def _read_calibration_file(path: str) -> Optional[ConfigParser]:
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _calibration_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    calibration_data = ConfigParser()
+    calibration_data.read(path)
+    _calibration_cache[path] = (mtime, calibration_data)
+    return calibration_data
+
 # signature expected for IMU callbacks
 ImuCallback = Callable[[Sequence[float], Sequence[float], Sequence[float], int, int, float, Any], None]
 
+# signature expected for batched IMU callbacks
+ImuBatchCallback = Callable[[Sequence[Sequence[int]], Sequence[Sequence[int]], Sequence[Sequence[int]], 
+                             Sequence[int], Sequence[int], Sequence[float], int, Any], None]
+
 # signature expected for ExtAna callbacks
 ExtAnaCallback = Callable[[int, int, int, int, float, Any], None]
 
+# signature expected for hardware state callbacks
+HardwareCallback = Callable[[int, Any], None]
+
+@dataclass
+class DeviceInfo:
+    """
+    Basic information about a connected SK8, as returned by :meth:`SK8.get_device_info`.
+
+    Attributes:
+        name (str): the device BLE name, or None on error
+        firmware_version (str): the firmware version string, or None on error
+        battery_level (int): battery level as a percentage, or -1 on error
+    """
+    name: Optional[str]
+    firmware_version: Optional[str]
+    battery_level: int
+
 class SK8:
 
-    def __init__(self, load_calibration: bool = True) -> None:
+    __slots__ = ('_firmware_version', '_imus', '_imu_update', '_imu_reset', '_extana_data', '_enabled_imus', 
+                 '_enabled_sensors', '_packets', '_services', '_user_imu_callback', '_user_imu_callback_data', 
+                 '_user_imu_batch_callback', '_user_imu_batch_callback_data', '_user_extana_callback', 
+                 '_user_extana_callback_data', '_user_hardware_callback', '_user_hardware_callback_data', 
+                 '_led_state', '_hardware', '_uuid_chars', '_uuid_cccds', 
+                 '_h_battery_level', '_h_device_name', '_h_firmware_revision', '_h_imu_selection', 
+                 '_h_sensor_selection', '_h_extana_led', '_h_extana_imu_streaming', '_h_hardware_state', 
+                 '_h_polling_override', '_char_imu_ccc', '_char_extana_ccc', '_char_hardware_state', 
+                 '_client', '_load_calibration', '_name', '_use_io_thread', '_io_loop', '_io_thread', 
+                 '_user_loop', '_imu_backlog', '_imu_backlog_timestamps', '_imu_backlog_event', 
+                 '_imu_backlog_limit', '_imu_drain_task', '_conn_params_request')
+
+    def __init__(self, load_calibration: bool = True, io_thread: bool = False) -> None:
+        """
+        Args:
+            load_calibration (bool): if True, attempt to load IMU calibration data 
+                on connection (see :meth:`load_calibration`)
+            io_thread (bool): if True, all BLE operations are run on an event loop 
+                in a dedicated background thread, so that slow data callbacks can't 
+                delay the handling of incoming packets. Callbacks are still 
+                called from the event loop that called :meth:`connect`. 
+        """
         self._firmware_version = 'unknown'
         self._imus = [IMUData(x) for x in range(MAX_IMUS)]
+        # bound methods for the packet handlers, to skip the per-packet lookups
+        self._imu_update = tuple(imu.update for imu in self._imus)
+        self._imu_reset = tuple(imu.reset for imu in self._imus)
         self._extana_data = ExtAnaData()
-        self._enabled_imus = []
+        self._enabled_imus: Tuple[int, ...] = ()
         self._enabled_sensors = SENSOR_ALL
         self._packets = 0
         self._services = {}
         self._user_imu_callback = None
         self._user_imu_callback_data = None
+        self._user_imu_batch_callback = None
+        self._user_imu_batch_callback_data = None
         self._user_extana_callback = None
         self._user_extana_callback_data = None
-        self._led_state = None
+        self._user_hardware_callback = None
+        self._user_hardware_callback_data = None
+        self._led_state = (-1, -1, -1)
         self._hardware = -1
         self._uuid_chars = {}
         self._uuid_cccds = {}
+        self._reset_handles()
         self._client: Optional[BleakClient] = None
         self._load_calibration = load_calibration
         self._name = None
+        self._use_io_thread = io_thread
+        self._io_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._io_thread: Optional[threading.Thread] = None
+        self._user_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._imu_backlog = bytearray()
+        self._imu_backlog_timestamps: deque[float] = deque()
+        self._imu_backlog_event: Optional[asyncio.Event] = None
+        self._imu_backlog_limit = 0
+        self._imu_drain_task: Optional[asyncio.Task] = None
+        self._conn_params_request: Any = None
+
+    def _reset_handles(self) -> None:
+        # handles/characteristics used by the API, resolved once on connection
+        self._h_battery_level: Optional[int] = None
+        self._h_device_name: Optional[int] = None
+        self._h_firmware_revision: Optional[int] = None
+        self._h_imu_selection: Optional[int] = None
+        self._h_sensor_selection: Optional[int] = None
+        self._h_extana_led: Optional[int] = None
+        self._h_extana_imu_streaming: Optional[int] = None
+        self._h_hardware_state: Optional[int] = None
+        self._h_polling_override: Optional[int] = None
+        self._char_imu_ccc: Optional[BleakGATTCharacteristic] = None
+        self._char_extana_ccc: Optional[BleakGATTCharacteristic] = None
+        self._char_hardware_state: Optional[BleakGATTCharacteristic] = None
+
+    def _resolve_handles(self) -> None:
+        """
+        Build a table of all the characteristics on the connected device, and cache
+        the handles of those used by the SK8 API so they don't need to be looked up 
+        on each call.
+        """
+        self._uuid_chars = {}
+        if self._client is None:
+            return
 
-    def _check_connected(self) -> bool:
-        return self._client is not None and self._client.is_connected
+        for service in self._client.services:
+            for char in service.characteristics:
+                self._uuid_chars.setdefault(char.uuid, char)
+
+        def find(*uuids: str) -> Optional[BleakGATTCharacteristic]:
+            # returns the first of the given UUIDs that exists 
+            for uuid in uuids:
+                char = self._uuid_chars.get(_normalize_uuid(uuid))
+                if char is not None:
+                    return char
+            return None
+
+        def handle(*uuids: str) -> Optional[int]:
+            char = find(*uuids)
+            return None if char is None else char.handle
+
+        self._h_battery_level = handle(UUID_BATTERY_LEVEL)
+        self._h_device_name = handle(UUID_DEVICE_NAME)
+        self._h_firmware_revision = handle(UUID_FIRMWARE_REVISION)
+        self._h_imu_selection = handle(UUID_IMU_SELECTION)
+        self._h_sensor_selection = handle(UUID_SENSOR_SELECTION)
+        self._h_extana_led = handle(UUID_EXTANA_LED)
+        self._h_extana_imu_streaming = handle(UUID_EXTANA_IMU_STREAMING, UUID_EXTANA_IMU_STREAMING_TMP)
+        self._h_hardware_state = handle(UUID_HARDWARE_STATE, UUID_HARDWARE_STATE_TMP)
+        self._h_polling_override = handle(UUID_POLLING_OVERRIDE)
+        self._char_imu_ccc = find(UUID_IMU_CCC)
+        self._char_extana_ccc = find(UUID_EXTANA_CCC)
+        self._char_hardware_state = find(UUID_HARDWARE_STATE, UUID_HARDWARE_STATE_TMP)
+
+    def _require_client(self) -> Optional[BleakClient]:
+        """
+        Returns the BleakClient if there is an active connection, otherwise None.
+        """
+        client = self._client
+        return client if client is not None and client.is_connected else None
+
+    def _start_io_thread(self) -> None:
+        self._io_loop = asyncio.new_event_loop()
+        self._io_thread = threading.Thread(target=self._io_loop.run_forever, name='pysk8-io', daemon=True)
+        self._io_thread.start()
+
+    def _stop_io_thread(self) -> None:
+        if self._io_loop is None or self._io_thread is None:
+            return
+
+        self._io_loop.call_soon_threadsafe(self._io_loop.stop)
+        self._io_thread.join()
+        self._io_loop.close()
+        self._io_loop, self._io_thread = None, None
+
+    async def _io(self, coro: Awaitable[T]) -> T:
+        """
+        Await a BLE operation, running it on the I/O thread if that is enabled.
+        """
+        if self._io_loop is None:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._io_loop)) # type: ignore
+
+    async def _start_notify(self, char: Optional[BleakGATTCharacteristic], 
+                            callback: Callable[[BleakGATTCharacteristic, bytearray], None]) -> None:
+        """
+        Enable notifications on a characteristic.
+
+        If the I/O thread is enabled, the callback is passed back to the user's 
+        event loop rather than being called on the I/O thread.
+        """
+        if self._client is None or char is None:
+            return
+
+        handler = callback
+        if self._io_loop is not None and self._user_loop is not None:
+            user_loop = self._user_loop
+
+            def marshal_to_user_loop(c: BleakGATTCharacteristic, data: bytearray) -> None:
+                user_loop.call_soon_threadsafe(callback, c, data)
+            handler = marshal_to_user_loop
+
+        await self._io(self._client.start_notify(char, handler))
+
+    async def _stop_notify(self, char: Optional[BleakGATTCharacteristic]) -> None:
+        if self._client is None or char is None:
+            return
+
+        await self._io(self._client.stop_notify(char))
 
     async def __aenter__(self):
         return self
@@ -82,7 +308,7 @@ class SK8:
         Context manager exit method.
         """
         if exc_type is not None:
-            logger.warning(f'__exit__ encountered an exception: {exc_type}, {exc_value}')
+            logger.warning('__exit__ encountered an exception: %s, %s', exc_type, exc_value)
             logger.warning(exc_traceback)
 
         await self.disconnect()
@@ -115,7 +341,7 @@ class SK8:
 
         for i in imus:
             if i < 0 or i >= MAX_IMUS:
-                logger.warn(f'Invalid IMU index {i} in set_calibration')
+                logger.warn('Invalid IMU index %s in set_calibration', i)
                 continue
             self._imus[i].set_calibration(enabled)
 
@@ -139,7 +365,8 @@ class SK8:
         produced by the sk8_calibration_gui application (TODO link!).
 
         By default, it will look for a file name "sk8calib.ini" in the current working
-        directory. This can be overridden using the `calibration_file` parameter.
+        directory. This can be overridden using the `calibration_file` parameter. The
+        parsed file is cached and reused until the file is modified.
 
         Args:
             calibration_file (str): Path to a user-specified calibration file (ini format).
@@ -148,29 +375,38 @@ class SK8:
             True if any calibration data was loaded, False if none was. Note that True will be
             returned even if for example only 1 IMU had any calibration data available.
         """
-        if self._client is None or not self._client.is_connected:
+        client = self._require_client()
+        if client is None:
             logger.error('No connected device')
             return False
 
-        logger.debug(f'Loading calibration for {self._client.address}')
-        calibration_data = ConfigParser()
+        logger.debug('Loading calibration for %s', client.address)
         path = calibration_file or os.path.join(os.getcwd(), 'sk8calib.ini')
-        logger.debug(f'Attempting to load calibration from {path}')
-        calibration_data.read(path)
+        logger.debug('Attempting to load calibration from %s', path)
+        calibration_data = _read_calibration_file(path)
+        if calibration_data is None:
+            logger.debug('No calibration file found at %s', path)
+            return False
+
         success = False
+        name = self._name
         for i in range(MAX_IMUS):
-            s = f'{self._name}_IMU{i}'
-            if s in calibration_data.sections():
-                logger.debug(f'Calibration data for device {s} was detected, extracting...')
-                success = success or self._imus[i].load_calibration(calibration_data[s])
+            s = f'{name}_IMU{i}'
+            if calibration_data.has_section(s):
+                logger.debug('Calibration data for device %s was detected, extracting...', s)
+                # always load the data, even if an earlier IMU already succeeded
+                success |= self._imus[i].load_calibration(calibration_data[s])
 
         return success
 
-    async def connect(self, name: Optional[str], address: Optional[str] = None, timeout: float = 3.0) -> bool:
+    async def connect(self, name: Optional[str], address: Optional[str] = None, timeout: float = 3.0, 
+                      low_latency: bool = False) -> bool:
         """
         Attempts to connect to an SK8 identified by name or address.
 
-        Calling this method will run a BLE scan for a device using the given timeout period. 
+        Calling this method will run a BLE scan for a device using the given timeout period,
+        unless the same device has already been found by an earlier call in this process 
+        (in which case a scan is only run if connecting to the previously found device fails). 
 
         Either or both name and address parameters can be supplied. If both are given address
         will be used instead of name. 
@@ -179,6 +415,8 @@ class SK8:
             name (str): an SK8 device name, or None
             address (str): an SK8 device address, or None
             timeout (float): scan timeout period
+            low_latency (bool): if True, ask the OS to use a short connection interval
+                after connecting (see :meth:`request_low_latency`)
 
         Returns:
             True if the connection was successful, False otherwise
@@ -189,16 +427,20 @@ class SK8:
             logger.error('Must supply either a name or address to connect to!')
             return False
 
-        if address is not None:
-            # prefer address over name 
-            logger.debug(f'Searching for device address={address}')
-            ble_device: BLEDevice = await BleakScanner.find_device_by_address(address, timeout=timeout)
+        self._user_loop = asyncio.get_running_loop()
+        if self._use_io_thread and self._io_loop is None:
+            self._start_io_thread()
+
+        # prefer address over name 
+        cached_device = _device_cache.get(address if address is not None else name) # type: ignore
+        if cached_device is not None:
+            logger.debug('Using cached device for name=%s/address=%s', name, address)
+            ble_device = cached_device
         else:
-            logger.debug(f'Searching for device name={name}')
-            ble_device: BLEDevice = await BleakScanner.find_device_by_name(name, timeout=timeout)
+            ble_device = await self._find_device(name, address, timeout)
 
         if ble_device is None:
-            logger.warning(f'Failed to find target device with name={name}/address={address}')
+            logger.warning('Failed to find target device with name=%s/address=%s', name, address)
             return False
 
         # most of the examples in the Bleak repo simply do
@@ -206,16 +448,113 @@ class SK8:
         #       ...
         # which implicitly connects when the context manager object is created and disconnects
         # when it goes out of scaope. To keep the client around instead we need to 
-        # create an instance of BleakClient normally and then call its connect() method
-        self._client = BleakClient(ble_device.address)
-        await self._client.connect()
+        # create an instance of BleakClient normally and then call its connect() method.
+        # Passing the BLEDevice rather than its address stops bleak from scanning again
+        try:
+            self._client = BleakClient(ble_device)
+            await self._io(self._client.connect())
+        except Exception:
+            _device_cache.pop(ble_device.address, None)
+            if ble_device.name is not None:
+                _device_cache.pop(ble_device.name, None)
+            if cached_device is None:
+                raise
+
+            # the cached device may be stale (e.g. if the SK8 has been power cycled), 
+            # so scan for it again and retry once
+            logger.debug('Failed to connect to cached device, scanning again')
+            ble_device = await self._find_device(name, address, timeout)
+            if ble_device is None:
+                logger.warning('Failed to find target device with name=%s/address=%s', name, address)
+                return False
+            self._client = BleakClient(ble_device)
+            await self._io(self._client.connect())
+
+        _device_cache[ble_device.address] = ble_device
+        if ble_device.name is not None:
+            _device_cache[ble_device.name] = ble_device
         logger.debug('Connection succeeded')
+        self._resolve_handles()
+
+        # the advertised name is the device name, so cache it now rather than 
+        # having to read it back from the device later
+        self._name = ble_device.name
+        if low_latency:
+            self.request_low_latency()
         if self._load_calibration:
-            logger.debug(f'Attempting to load calibration for addr={self._client.address}')
+            logger.debug('Attempting to load calibration for addr=%s', self._client.address)
             self.load_calibration()
 
         return True
 
+    async def _find_device(self, name: Optional[str], address: Optional[str], timeout: float) -> Optional[BLEDevice]:
+        if address is not None:
+            logger.debug('Searching for device address=%s', address)
+            return await self._io(BleakScanner.find_device_by_address(address, timeout=timeout))
+
+        logger.debug('Searching for device name=%s', name)
+        return await self._io(BleakScanner.find_device_by_name(name, timeout=timeout)) # type: ignore
+
+    def request_low_latency(self) -> bool:
+        """
+        Ask the OS to use a short BLE connection interval for this device.
+
+        By default the OS chooses the connection interval, which is typically 
+        30-50ms and limits how quickly data can be moved between the host and 
+        the SK8. Requesting a throughput-optimised interval reduces latency
+        when streaming, at the cost of higher power usage. 
+
+        NOTE: bleak has no cross-platform API for this. Currently this is only 
+        supported with the WinRT backend on Windows 11 and later, and on 
+        other platforms it has no effect and returns False. The request stays 
+        in effect until :meth:`disconnect` is called.
+
+        Returns:
+            True if the request was accepted, False if unsupported, rejected or an error occurred.
+        """
+        client = self._require_client()
+        if client is None:
+            logger.error('No device configured or connected')
+            return False
+
+        # the WinRT backend keeps the BluetoothLEDevice for the connection here
+        requester = getattr(getattr(client, '_backend', None), '_requester', None)
+        if requester is None or not hasattr(requester, 'request_preferred_connection_parameters'):
+            logger.debug('Connection parameter requests not supported on this platform')
+            return False
+
+        try:
+            from winrt.windows.devices.bluetooth import ( # type: ignore
+                BluetoothLEPreferredConnectionParameters, 
+                BluetoothLEPreferredConnectionParametersRequestStatus,
+            )
+            request = requester.request_preferred_connection_parameters(
+                BluetoothLEPreferredConnectionParameters.throughput_optimized)
+        except Exception as e:
+            logger.warning('Failed to request connection parameters: %s', e)
+            return False
+
+        if request.status != BluetoothLEPreferredConnectionParametersRequestStatus.SUCCESS:
+            logger.warning('Connection parameter request failed with status %s', request.status)
+            request.close()
+            return False
+
+        # the OS only applies the parameters while the request object is open,
+        # so keep it until disconnecting
+        self._close_conn_params_request()
+        self._conn_params_request = request
+        return True
+
+    def _close_conn_params_request(self) -> None:
+        if self._conn_params_request is None:
+            return
+
+        try:
+            self._conn_params_request.close()
+        except Exception as e:
+            logger.debug('Failed to close connection parameter request: %s', e)
+        self._conn_params_request = None
+
     async def disconnect(self) -> bool:
         """
         Disconnect the dongle from this SK8.
@@ -226,12 +565,22 @@ class SK8:
             bool. True if connection was closed, False if not (e.g. if already closed).
         """
         result = False
-        logger.debug(f'SK8.disconnect({self._client})')
+        logger.debug('SK8.disconnect(%s)', self._client)
         if self._client is not None:
             logger.debug('Calling disconnect')
-            result = await self._client.disconnect()
+            self._close_conn_params_request()
+            result = await self._io(self._client.disconnect())
             self._packets = 0
+            self._name = None
+            self._firmware_version = 'unknown'
+            self._hardware = -1
+            self._led_state = (-1, -1, -1)
+            self._uuid_chars = {}
+            self._reset_handles()
+
+        await self._stop_imu_drain_task()
 
+        self._stop_io_thread()
         return result
 
     def set_extana_callback(self, callback: ExtAnaCallback, data: Any = None) -> None:
@@ -277,33 +626,28 @@ class SK8:
         Returns:
             bool. True if successful, False if an error occurred.
         """
-        if self._client is None or not self._client.is_connected:
+        if self._require_client() is None:
             logger.error('No connected device')
             return False
 
-        # if we want to stream the internal IMU data too, set this up first
-        await self.enable_imu_streaming([0], enabled_sensors)
-
-        extana_imu_streaming_handle = self._get_characteristic_handle_from_uuid(UUID_EXTANA_IMU_STREAMING)
-        extana_imu_streaming_tmp_handle = self._get_characteristic_handle_from_uuid(UUID_EXTANA_IMU_STREAMING_TMP)
-        if extana_imu_streaming_handle is None and extana_imu_streaming_tmp_handle is None:
+        if self._h_extana_imu_streaming is None or self._char_extana_ccc is None:
             logger.error('Failed to find handle for ExtAna configuration')
             return False
 
+        # if we want to stream the internal IMU data too, set this up first
+        await self.enable_imu_streaming([0], enabled_sensors)
+
         # write to the characteristic that will enable sending of IMU packets while 
         # the ExtAna streaming is active
-        if extana_imu_streaming_handle is not None:
-            await self._write_attribute(extana_imu_streaming_handle, struct.pack('B', 1 if include_imu else 0))
-        elif extana_imu_streaming_tmp_handle is not None:
-            await self._write_attribute(extana_imu_streaming_tmp_handle, struct.pack('B', 1 if include_imu else 0))
+        await self._write_attribute(self._h_extana_imu_streaming, _U8(1 if include_imu else 0))
 
-        await self._client.start_notify(self._get_characteristic_from_uuid(UUID_EXTANA_CCC), self._extana_callback)
+        await self._start_notify(self._char_extana_ccc, self._extana_callback)
 
         self._enabled_sensors = enabled_sensors
 
         # have to add IMU #0 to enabled_imus if include_imu is True
         if include_imu:
-            self._enabled_imus = [0]
+            self._enabled_imus = (0,)
 
         return True
 
@@ -314,17 +658,24 @@ class SK8:
         Returns:
             True on success, False if an error occurred.
         """
-        if self._client is None or not self._client.is_connected:
+        if self._require_client() is None:
             logger.error('No device configured or connected')
             return False
 
-        await self._client.stop_notify(self._get_characteristic_from_uuid(UUID_EXTANA_CCC))
+        await self._stop_notify(self._char_extana_ccc)
         # reset IMU data state
-        for imu in self._imus:
-            imu.reset()
-        self._enabled_imus = []
+        for reset in self._imu_reset:
+            reset()
+        self._enabled_imus = ()
         return True
 
+    @property
+    def led_state(self) -> Tuple[int, int, int]:
+        """
+        The last (R, G, B) colour set with :meth:`set_extana_led`, or (-1, -1, -1) if not known.
+        """
+        return self._led_state
+
     async def get_extana_led(self, cached: bool = True) -> Tuple[int, int, int]:
         """
         Returns the current (R, G, B) colour of the SK8-ExtAna LED.
@@ -338,9 +689,9 @@ class SK8:
             a 3-tuple (r, g, b) (all unsigned integers) in the range 0-255, or (-1, -1, -1) on error.
         """
         if cached:
-            return self.led_state
+            return self._led_state
 
-        extana_led = self._get_characteristic_handle_from_uuid(UUID_EXTANA_LED)
+        extana_led = self._h_extana_led
         if extana_led is None:
             logger.warn('Failed to find handle for ExtAna LED')
             return (-1, -1, -1)
@@ -349,9 +700,10 @@ class SK8:
         if rgb is None:
             return (-1, -1, -1)
 
-        return tuple(map(lambda x: int(x * (LED_MAX / INT_LED_MAX)), struct.unpack('<HHH', rgb)))
+        r, g, b = _LED_STRUCT.unpack(rgb)
+        return (int(r * _LED_FROM_INT_SCALE), int(g * _LED_FROM_INT_SCALE), int(b * _LED_FROM_INT_SCALE))
         
-    def set_extana_led(self, r: int, g: int, b: int, check_state: bool = True) -> bool:
+    async def set_extana_led(self, r: int, g: int, b: int, check_state: bool = True) -> bool:
         """
         Update the colour of the RGB LED on the SK8-ExtAna board.
 
@@ -368,29 +720,31 @@ class SK8:
             True on success, False if an error occurred.
         """
 
-        r, g, b = map(int, [r, g, b])
+        if self._require_client() is None:
+            logger.error('No device configured or connected')
+            return False
+
+        r, g, b = int(r), int(g), int(b)
 
-        if min([r, g, b]) < LED_MIN or max([r, g, b]) > LED_MAX:
-            logger.warn(f'RGB channel values must be {LED_MIN}-{LED_MAX}')
+        if not (LED_MIN <= r <= LED_MAX and LED_MIN <= g <= LED_MAX and LED_MIN <= b <= LED_MAX):
+            logger.warn('RGB channel values must be %s-%s', LED_MIN, LED_MAX)
             return False
 
-        if check_state and (r, g, b) == self.led_state:
+        if check_state and (r, g, b) == self._led_state:
             return True
 
-        # internally range is 0-3000
-        ir, ig, ib = map(lambda x: int(x * (INT_LED_MAX / LED_MAX)), [r, g, b])
-        val = struct.pack('<HHH', ir, ig, ib)
-
-        extana_led = self._get_characteristic_handle_from_uuid(UUID_EXTANA_LED)
+        extana_led = self._h_extana_led
         if extana_led is None:
             logger.warn('Failed to find handle for ExtAna LED')
             return False
-            
-        if not self._write_attribute(extana_led, val):
+
+        # internally range is 0-3000
+        val = _LED_STRUCT.pack(int(r * _LED_TO_INT_SCALE), int(g * _LED_TO_INT_SCALE), int(b * _LED_TO_INT_SCALE))
+        if not await self._write_attribute(extana_led, val):
             return False
 
         # update cached LED state if successful
-        self.led_state = (r, g, b)
+        self._led_state = (r, g, b)
         return True
 
     def set_imu_callback(self, callback: ImuCallback, data: Any = None) -> None:
@@ -416,7 +770,37 @@ class SK8:
         self._user_imu_callback = callback
         self._user_imu_callback_data = data
 
-    async def enable_imu_streaming(self, enabled_imus: List[int], enabled_sensors: int = SENSOR_ALL) -> bool:
+    def set_imu_batch_callback(self, callback: ImuBatchCallback, data: Any = None) -> None:
+        """
+        Register a callback for batches of incoming IMU data packets.
+
+        This is an alternative to :meth:`set_imu_callback` for high data rates. 
+        Instead of being called once per packet, the callback is called once for
+        each batch of packets decoded when streaming with `batched=True` (see 
+        :meth:`enable_imu_streaming`), with the data arranged as one sequence per
+        field rather than one tuple per packet. Each sequence is an `array.array`,
+        so it can be wrapped without copying by anything supporting the buffer 
+        protocol (e.g. `numpy.frombuffer`). It is not called in unbatched mode.
+        Set to `None` to disable it again.
+
+        Args:
+            callback: a callable with the following signature:
+                (acc, gyro, mag, imu_index, seq, timestamp, count, data)
+              where:
+                acc, gyro, mag = sensor data ([xs, ys, zs] in each case)
+                imu_index = originating IMU numbers (ints, 0-4)
+                seq = packet sequence numbers (ints, 0-255)
+                timestamp = values of time.time() when each packet was received
+                count = number of packets in the batch
+                data = value of `data` parameter passed to this method
+            data: an optional arbitrary object that will be passed as a 
+                parameter to the callback
+        """
+        self._user_imu_batch_callback = callback
+        self._user_imu_batch_callback_data = data
+
+    async def enable_imu_streaming(self, enabled_imus: List[int], enabled_sensors: int = SENSOR_ALL, batched: bool = False, 
+                                   max_backlog: int = 0) -> bool:
         """
         Configures and enables IMU sensor data streaming.
 
@@ -434,49 +818,72 @@ class SK8:
                 a bitwise OR of one or more of :const:`SENSOR_ACC`, 
                 :const:`SENSOR_MAG`, and :const:`SENSOR_GYRO` to gain finer
                 control over the active sensors.
+            batched (bool): if True, incoming packets are only buffered by the
+                notification handler, and a background task decodes everything
+                that has accumulated in a single pass. This helps to keep up 
+                when packets arrive in bursts, e.g. after a slow callback. 
+            max_backlog (int): in batched mode, the maximum number of packets to 
+                buffer before the oldest are discarded, so that a slow consumer
+                can't fall further and further behind. Discarded packets are 
+                counted as lost by :class:`pysk8.imu.IMUData`. Set to 1 to only 
+                receive the latest packet, or 0 (default) for no limit.
 
         Returns:
             bool. True if successful, False if an error occurred.
         """
 
-        if self._client is None or not self._client.is_connected:
+        client = self._require_client()
+        if client is None:
             logger.error('No device configured or connected')
             return False
 
+        # reject invalid indices before writing anything to the device
         imus_enabled = 0
         for imu in enabled_imus:
-            imus_enabled |= (1 << imu)
+            if imu < 0 or imu >= MAX_IMUS:
+                logger.error('Invalid IMU index %s in enable_imu_streaming', imu)
+                return False
+            imus_enabled |= 1 << imu
 
         if enabled_sensors == 0:
             logger.warn('Not enabling IMUs, no sensors enabled!')
             return False
 
         # need to configure the IMU state on the device first, then enable notifications
-        imu_select = self._get_characteristic_handle_from_uuid(UUID_IMU_SELECTION)
-        sensor_select = self._get_characteristic_handle_from_uuid(UUID_SENSOR_SELECTION)
-        if imu_select is None or sensor_select is None:
+        imu_select = self._h_imu_selection
+        sensor_select = self._h_sensor_selection
+        if imu_select is None or sensor_select is None or self._char_imu_ccc is None:
             logger.error('Failed to configure IMUs for streaming!')
             return False
 
-        logger.debug(f'setting IMU state = {imus_enabled:02X} on device {self._client.address}')
-        await self._write_attribute(imu_select, struct.pack('B', imus_enabled))
-        await self._write_attribute(sensor_select, struct.pack('B', enabled_sensors))
-
-        await self._client.start_notify(self._get_characteristic_from_uuid(UUID_IMU_CCC), self._imu_callback)
+        logger.debug('setting IMU state = %02X on device %s', imus_enabled, client.address)
+        # the two settings are independent, so send both writes without waiting for
+        # the first to complete (both are still done before notifications are enabled)
+        await asyncio.gather(
+            self._write_attribute(imu_select, _U8(imus_enabled)),
+            self._write_attribute(sensor_select, _U8(enabled_sensors)),
+        )
+
+        if batched:
+            self._imu_backlog_limit = max_backlog
+            self._start_imu_drain_task()
+            await self._start_notify(self._char_imu_ccc, self._imu_batch_callback)
+        else:
+            await self._start_notify(self._char_imu_ccc, self._imu_callback)
 
-        self._enabled_imus = enabled_imus
+        self._enabled_imus = tuple(enabled_imus)
         self._enabled_sensors = enabled_sensors
         return True
 
-    def get_enabled_imus(self) -> List[int]:
+    def get_enabled_imus(self) -> Tuple[int, ...]:
         """
         Returns the set of currently enabled IMUs.
 
-        This method returns a copy of the list of enabled IMUs as most recently
+        This method returns a tuple of the enabled IMUs as most recently
         passed to the :meth:`enable_imu_streaming` method. 
 
         Returns:
-            The list will contain ints from 0-4, up to a maximum of 5 entries, and may be empty if no IMUs are enabled. 
+            The tuple will contain ints from 0-4, up to a maximum of 5 entries, and may be empty if no IMUs are enabled. 
         """
         return self._enabled_imus
 
@@ -499,14 +906,15 @@ class SK8:
         Returns:
             True on success, False if an error occurred.
         """
-        if self._client is None or not self._client.is_connected:
+        if self._require_client() is None:
             logger.error('No device configured or connected')
             return False
 
-        await self._client.stop_notify(self._get_characteristic_from_uuid(UUID_IMU_CCC))
+        await self._stop_notify(self._char_imu_ccc)
+        await self._stop_imu_drain_task()
         # reset IMU data state
-        for imu in self._imus:
-            imu.reset()
+        for reset in self._imu_reset:
+            reset()
         return True
 
     async def get_battery_level(self) -> int:
@@ -518,15 +926,15 @@ class SK8:
             battery level as a percentage. On error, -1 is returned. 
         """
 
-        battery_level = self._get_characteristic_handle_from_uuid(UUID_BATTERY_LEVEL)
+        battery_level = self._h_battery_level
         if battery_level is None:
             logger.warn('Failed to find handle for battery level')
             return -1
 
         level = await self._read_attribute(battery_level)
-        if level is None:
+        if not level:
             return -1
-        return ord(level.decode('ascii'))
+        return level[0]
 
     async def get_device_name(self, cached: bool = True) -> Optional[str]:
         """
@@ -539,14 +947,14 @@ class SK8:
         Returns:
             str. The current device name. May be `None` if an error occurs.
         """
-        if self._client is None or not self._client.is_connected:
+        if self._require_client() is None:
             logger.error('No device configured or connected')
             return None
 
         if cached and self._name is not None:
             return self._name
 
-        device_name = self._get_characteristic_handle_from_uuid(UUID_DEVICE_NAME)
+        device_name = self._h_device_name
         if device_name is None:
             logger.warn('Failed to find handle for device name')
             return None
@@ -568,24 +976,29 @@ class SK8:
         Returns:
             True if the name was updated successfully, False otherwise.
         """
-        if self._client is None or not self._client.is_connected:
+        if self._require_client() is None:
             logger.error('No device configured or connected')
             return False
 
         if len(new_name) > MAX_DEVICE_NAME_LEN:
-            logger.error(f'Device name exceeds maximum length ({len(new_name)} > {MAX_DEVICE_NAME_LEN})')
+            logger.error('Device name exceeds maximum length (%s > %s)', len(new_name), MAX_DEVICE_NAME_LEN)
             return False
 
         if new_name is None or len(new_name) == 0: # type: ignore
             logger.error('Device name cannot be set to None or empty string!')
             return False
 
-        device_name = self._get_characteristic_handle_from_uuid(UUID_DEVICE_NAME)
+        device_name = self._h_device_name
         if device_name is None:
             logger.warn('Failed to find handle for device name')
             return False
         
         if await self._write_attribute(device_name, new_name.encode('ascii')):
+            # the cached BLEDevice still has the old name, so drop it and let
+            # the next connect() find the device again under its new name
+            _device_cache.pop(self._client.address, None) # type: ignore
+            if self._name is not None:
+                _device_cache.pop(self._name, None)
             self._name = new_name
             return True
 
@@ -619,14 +1032,14 @@ class SK8:
         Returns:
             str. The current firmware version string. May be `None` if an error occurs.
         """
-        if self._client is None or not self._client.is_connected:
+        if self._require_client() is None:
             logger.error('No device configured or connected')
             return None
 
         if cached and self._firmware_version != 'unknown':
             return self._firmware_version
 
-        char = self._get_characteristic_handle_from_uuid(UUID_FIRMWARE_REVISION)
+        char = self._h_firmware_revision
         if char is None:
             logger.warn('Failed to find handle for firmware version')
             return None
@@ -639,6 +1052,23 @@ class SK8:
         self._firmware_version = fwver.decode('ascii')
         return self._firmware_version
 
+    async def get_device_info(self) -> DeviceInfo:
+        """
+        Returns the device name, firmware version and battery level in a single call.
+
+        The underlying GATT reads are issued concurrently rather than one after
+        the other, so this is faster than calling :meth:`get_device_name`, 
+        :meth:`get_firmware_version` and :meth:`get_battery_level` in sequence.
+
+        Returns:
+            :class:`DeviceInfo` object. Fields follow the error conventions of the
+            individual methods (None or -1).
+        """
+        name, firmware_version, battery_level = await asyncio.gather(
+            self.get_device_name(), self.get_firmware_version(), self.get_battery_level()
+        )
+        return DeviceInfo(name, firmware_version, battery_level)
+
     def get_imu(self, imu_number: int) -> Optional[IMUData]:
         """
         Returns a :class:`pysk8.imu.IMUData` object representing one of the attached IMUs.
@@ -665,43 +1095,186 @@ class SK8:
         return self._extana_data
 
     def _imu_callback(self, _: BleakGATTCharacteristic, data: bytearray) -> None:
-        _data = IMU_DATA_STRUCT.unpack(data)
-        #self._update_sensors(_data[:3], _data[3:6], _data[6:9], _data[9], _data[10], time.time())
-        acc, gyro, mag, imu, seq = _data[:3], _data[3:6], _data[6:9], _data[9], _data[10]
-        timestamp = time.time()
-        self._imus[imu].update(acc, gyro, mag, seq, timestamp)
+        # decode and dispatch directly from the notification handler rather than 
+        # scheduling the work on the event loop, to avoid a loop iteration per packet
+        self._process_imu_packet(_UNPACK_IMU(data), _time())
+
+    def _process_imu_packet(self, _data: Tuple[int, ...], timestamp: float) -> None:
+        acc, gyro, mag, imu, seq = _data[0:3], _data[3:6], _data[6:9], _data[9], _data[10]
+        self._imu_update[imu](acc, gyro, mag, seq, timestamp)
         # call the registered IMU callback if any
-        if self._user_imu_callback is not None:
-            self._user_imu_callback(acc, gyro, mag, imu, seq, timestamp, self._user_imu_callback_data)
+        callback = self._user_imu_callback
+        if callback is not None:
+            callback(acc, gyro, mag, imu, seq, timestamp, self._user_imu_callback_data)
+
+    def _imu_batch_callback(self, _: BleakGATTCharacteristic, data: bytearray) -> None:
+        if len(data) != IMU_DATA_STRUCT.size:
+            logger.warning('Discarding IMU packet with unexpected length %s', len(data))
+            return
+
+        if self._imu_backlog_limit > 0 and len(self._imu_backlog_timestamps) >= self._imu_backlog_limit:
+            # overwrite the oldest packet rather than letting the backlog grow
+            del self._imu_backlog[:IMU_DATA_STRUCT.size]
+            self._imu_backlog_timestamps.popleft()
+
+        self._imu_backlog += data
+        self._imu_backlog_timestamps.append(_time())
+        if self._imu_backlog_event is not None:
+            self._imu_backlog_event.set()
+
+    def _start_imu_drain_task(self) -> None:
+        if self._imu_drain_task is not None and not self._imu_drain_task.done():
+            return
+
+        self._imu_backlog_event = asyncio.Event()
+        self._imu_drain_task = asyncio.get_running_loop().create_task(self._drain_imu_backlog())
+
+    async def _stop_imu_drain_task(self) -> None:
+        if self._imu_drain_task is None:
+            return
+
+        task = self._imu_drain_task
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception('IMU backlog task failed')
+        finally:
+            self._imu_drain_task, self._imu_backlog_event = None, None
+            self._imu_backlog = bytearray()
+            self._imu_backlog_timestamps = deque()
+
+    async def _drain_imu_backlog(self) -> None:
+        """
+        Decode all buffered IMU packets each time new data arrives.
+        """
+        assert self._imu_backlog_event is not None
+        while True:
+            await self._imu_backlog_event.wait()
+            self._imu_backlog_event.clear()
+
+            # swap buffers so the handler can keep appending while we decode
+            backlog, timestamps = self._imu_backlog, self._imu_backlog_timestamps
+            self._imu_backlog, self._imu_backlog_timestamps = bytearray(), deque()
+            try:
+                self._process_imu_backlog(backlog, timestamps)
+            except Exception:
+                # don't let an error in one batch (e.g. from a user callback) stop the
+                # task, or the backlog would keep growing with nothing to drain it
+                logger.exception('Error processing IMU backlog')
+
+    def _process_imu_backlog(self, backlog: bytearray, timestamps: deque[float]) -> None:
+        packets = list(_ITER_UNPACK_IMU(backlog))
+        for _data, timestamp in zip(packets, timestamps, strict=True):
+            self._process_imu_packet(_data, timestamp)
+
+        # call the registered batch callback if any, with one typed array per field
+        if self._user_imu_batch_callback is not None and len(packets) > 0:
+            fields = [array(t, f) for t, f in zip(_IMU_FIELD_TYPECODES, zip(*packets, strict=True), strict=True)]
+            self._user_imu_batch_callback(fields[0:3], fields[3:6], fields[6:9], fields[9], fields[10], 
+                                          array('d', timestamps), len(packets), self._user_imu_batch_callback_data)
 
     def _extana_callback(self, _: BleakGATTCharacteristic, data: bytearray) -> None:
-        _data = EXTANA_DATA_STRUCT.unpack(data)
-        ch1, ch2, temp, seq = _data[0], _data[1], _data[2], _data[3]
-        timestamp = time.time()
+        ch1, ch2, temp, seq = _UNPACK_EXTANA(data)
+        timestamp = _time()
         self._extana_data.update(ch1, ch2, temp, seq, timestamp)
         # call the registered ExtAna callback if any
-        if self._user_extana_callback is not None:
-            self._user_extana_callback(ch1, ch2, temp, seq, timestamp, self._user_extana_callback_data)
+        callback = self._user_extana_callback
+        if callback is not None:
+            callback(ch1, ch2, temp, seq, timestamp, self._user_extana_callback_data)
 
     async def _check_hardware(self):
-        hardware_state = self._get_characteristic_handle_from_uuid(UUID_HARDWARE_STATE)
-        hardware_state_tmp = self._get_characteristic_handle_from_uuid(UUID_HARDWARE_STATE_TMP)
-        if hardware_state is None and hardware_state_tmp is None:
+        if self._h_hardware_state is None:
             logger.error('Failed to find handle for hardware state')
             return -1
 
-        if hardware_state is not None:
-            hardware = await self._read_attribute(hardware_state)
-        elif hardware_state_tmp is not None:
-            hardware = await self._read_attribute(hardware_state_tmp)
-        else:
-            hardware = None
-
+        hardware = await self._read_attribute(self._h_hardware_state)
         if hardware is None:
             return -1
 
-        self.hardware = hardware[0]
-        return self.hardware
+        self._hardware = hardware[0]
+        return self._hardware
+
+    def _hardware_callback(self, _: BleakGATTCharacteristic, data: bytearray) -> None:
+        self._hardware = data[0]
+        # call the registered hardware callback if any
+        if self._user_hardware_callback is not None:
+            self._user_hardware_callback(self._hardware, self._user_hardware_callback_data)
+
+    @property
+    def hardware(self) -> int:
+        """
+        The last known hardware state of the SK8.
+
+        This is a bitmask of EXT_HW_ constants, updated by :meth:`has_extana`, 
+        :meth:`has_imus` and hardware state notifications, or -1 if not known yet.
+        """
+        return self._hardware
+
+    async def enable_hardware_notifications(self, callback: HardwareCallback, data: Any = None) -> bool:
+        """
+        Register a callback for changes to the hardware attached to the SK8.
+
+        This avoids having to repeatedly poll :meth:`has_imus` or :meth:`has_extana`
+        to detect when an IMU chain or SK8-ExtAna board is connected or removed. 
+        While notifications are enabled, the values cached by those methods are 
+        also kept up to date. 
+
+        NOTE: this requires firmware which supports notifications on the hardware
+        state characteristic. If it doesn't, False is returned and you will have to 
+        poll for changes instead. 
+
+        Args:
+            callback: a callable with the following signature:
+                (hardware, data)
+              where:
+                hardware = bitmask of EXT_HW_ constants for the attached hardware
+                data = value of `data` parameter passed to this method
+            data: an optional arbitrary object that will be passed as a 
+                parameter to the callback
+
+        Returns:
+            bool. True if notifications were enabled, False if not supported or an error occurred.
+        """
+        if self._require_client() is None:
+            logger.error('No device configured or connected')
+            return False
+
+        char = self._char_hardware_state
+        if char is None:
+            logger.error('Failed to find handle for hardware state')
+            return False
+
+        if 'notify' not in char.properties and 'indicate' not in char.properties:
+            logger.info('Hardware state notifications not supported by this firmware')
+            return False
+
+        self._user_hardware_callback = callback
+        self._user_hardware_callback_data = data
+        await self._start_notify(char, self._hardware_callback)
+        return True
+
+    async def disable_hardware_notifications(self) -> bool:
+        """
+        Disable hardware state notifications for this device.
+
+        Returns:
+            True on success, False if an error occurred.
+        """
+        if self._require_client() is None:
+            logger.error('No device configured or connected')
+            return False
+
+        char = self._char_hardware_state
+        if char is None or self._user_hardware_callback is None:
+            return False
+
+        await self._stop_notify(char)
+        self._user_hardware_callback = None
+        self._user_hardware_callback_data = None
+        return True
 
     async def has_extana(self, cached: bool = True) -> bool:
         """
@@ -716,11 +1289,8 @@ class SK8:
         Returns:
             bool. True if the SK8 currently has an SK8-ExtAna device attached, False otherwise.
         """
-        if cached and self.hardware != -1:
-            return True if (self.hardware & EXT_HW_EXTANA) else False
-
-        result = await self._check_hardware()
-        return True if (result & EXT_HW_EXTANA) != 0 else False
+        hardware = self._hardware if cached and self._hardware != -1 else await self._check_hardware()
+        return hardware != -1 and (hardware & EXT_HW_EXTANA) != 0
 
     async def has_imus(self, cached: bool = True) -> bool:
         """
@@ -735,11 +1305,8 @@ class SK8:
         Returns:
             bool. True if the SK8 currently has an IMU chain attached, False otherwise.
         """
-        if cached and self.hardware != -1:
-            return True if (self.hardware & EXT_HW_IMUS) else False
-
-        result = await self._check_hardware()
-        return True if (result & EXT_HW_IMUS) != 0 else False
+        hardware = self._hardware if cached and self._hardware != -1 else await self._check_hardware()
+        return hardware != -1 and (hardware & EXT_HW_IMUS) != 0
 
     async def dump_services(self) -> None:
         """
@@ -748,30 +1315,40 @@ class SK8:
         Returns:
             Nothing
         """
-        if self._client is None or not self._client.is_connected:
+        client = self._require_client()
+        if client is None:
             logger.error('Device is not set or not connected')
             return
 
-        for service in self._client.services:
+        # issue all the reads together rather than waiting for each in turn
+        readable = [char for service in client.services for char in service.characteristics if "read" in char.properties]
+        descriptors = [descriptor for service in client.services for char in service.characteristics 
+                       for descriptor in char.descriptors]
+        values = await asyncio.gather(*[self._io(client.read_gatt_char(char)) for char in readable], 
+                                      *[self._io(client.read_gatt_descriptor(d.handle)) for d in descriptors], 
+                                      return_exceptions=True)
+        char_values, descriptor_values = iter(values[:len(readable)]), iter(values[len(readable):])
+
+        for service in client.services:
             logger.info("[Service] %s", service)
 
             for char in service.characteristics:
                 if "read" in char.properties:
-                    try:
-                        value = await self._client.read_gatt_char(char.uuid)
+                    value = next(char_values)
+                    if isinstance(value, Exception):
+                        logger.error( "  [Characteristic] %s (%s), Error: %s", char, ",".join(char.properties), value)
+                    else:
                         logger.info( "  [Characteristic] %s (%s), Value: %r", char, ",".join(char.properties), value)
-                    except Exception as e:
-                        logger.error( "  [Characteristic] %s (%s), Error: %s", char, ",".join(char.properties), e)
 
                 else:
                     logger.info( "  [Characteristic] %s (%s)", char, ",".join(char.properties))
 
                 for descriptor in char.descriptors:
-                    try:
-                        value = await self._client.read_gatt_descriptor(descriptor.handle)
+                    value = next(descriptor_values)
+                    if isinstance(value, Exception):
+                        logger.error("    [Descriptor] %s, Error: %s", descriptor, value)
+                    else:
                         logger.info("    [Descriptor] %s, Value: %r", descriptor, value)
-                    except Exception as e:
-                        logger.error("    [Descriptor] %s, Error: %s", descriptor, e)
 
     async def _read_attribute(self, handle: int) -> Optional[bytearray]:
         """
@@ -783,16 +1360,17 @@ class SK8:
         Returns:
             None on error, otherwise the content of the characteristic.
         """
-        if self._client is None or not self._client.is_connected:
+        client = self._require_client()
+        if client is None:
             logger.error('No device configured or connected')
             return None
 
-        logger.debug(f'Reading attribute with handle {handle}')
-        result = await self._client.read_gatt_char(handle)
-        logger.debug(f'read_attribute {handle} = {result}')
+        logger.debug('Reading attribute with handle %s', handle)
+        result = await self._io(client.read_gatt_char(handle))
+        logger.debug('read_attribute %s = %s', handle, result)
         return result
 
-    async def _write_attribute(self, handle: int, data: Union[bytes, bytearray]) -> None:
+    async def _write_attribute(self, handle: int, data: Union[bytes, bytearray]) -> bool:
         """
         Write a value to a GATT characteristic handle.
 
@@ -801,53 +1379,16 @@ class SK8:
             data (bytes or bytearray): the data to write
 
         Returns:
-            None
-        """
-        if self._client is None or not self._client.is_connected:
-            logger.error('No device configured or connected')
-            return
-
-        logger.debug(f'write_attribute: {data} --> {handle}')
-        await self._client.write_gatt_char(handle, data)
-
-    def _get_characteristic_handle_from_uuid(self, uuid: str) -> Optional[int]:
-        """Given a characteristic UUID, return its handle.
-    
-        Args:
-            uuid (str): a string containing the hex-encoded UUID
-
-        Returns:
-            None if an error occurs, otherwise an integer handle. 
-        """
-        ch = self._get_characteristic_from_uuid(bleak.uuids.normalize_uuid_str(uuid))
-        return None if ch is None else ch.handle
-
-    def _get_characteristic_from_uuid(self, uuid: str) -> Optional[BleakGATTCharacteristic]:
-        """Given a characteristic UUID, return a :class:`BleakGATTCharacteristic` object
-        containing information about that characteristic
-
-        Args:
-            uuid (str): a string containing the hex-encoded UUID
-
-        Returns:
-            None if an error occurs, otherwise a :class:`BleakGATTCharacteristic` object
+            True if the value was written, False if there is no connection
         """
-        if self._client is None or not self._client.is_connected:
+        client = self._require_client()
+        if client is None:
             logger.error('No device configured or connected')
-            return None
-
-        if uuid in self._uuid_chars:
-            logger.debug(f'Returning cached info for char: {uuid}')
-            return self._uuid_chars[uuid]
-
-        char = self._client.services.get_characteristic(uuid)
-        if char is None:
-            logger.warning(f'Failed to find char for UUID: {uuid}')
-            return None
+            return False
 
-        logger.debug(f'Found char for UUID: {uuid}')
-        self._uuid_chars[uuid] = char
-        return char
+        logger.debug('write_attribute: %s --> %s', data, handle)
+        await self._io(client.write_gatt_char(handle, data))
+        return True
 
     async def get_polling_override(self) -> Optional[int]:
         """
@@ -859,16 +1400,16 @@ class SK8:
             None on error, otherwise the current override period in milliseconds 
             (0 = disabled). 
         """
-        polling_override = self._get_characteristic_handle_from_uuid(UUID_POLLING_OVERRIDE)
+        polling_override = self._h_polling_override
         if polling_override is None:
             logger.warn('Failed to find handle for polling override')
             return None
         override_ms = await self._read_attribute(polling_override)
-        if override_ms is None:
+        if not override_ms:
             logger.error('Failed to get polling override value')
             return None
 
-        return ord(override_ms)
+        return override_ms[0]
 
     async def set_polling_override(self, override: int) -> bool:
         """
@@ -909,13 +1450,79 @@ class SK8:
         Returns:
             True on success, False on error.
         """
-        polling_override = self._get_characteristic_handle_from_uuid(UUID_POLLING_OVERRIDE)
+        polling_override = self._h_polling_override
         if polling_override is None:
-            logger.warn('Failed to find handle for device name')
+            logger.warn('Failed to find handle for polling override')
             return False
         
-        if await self._write_attribute(polling_override, struct.pack('B', override)):
-            return True
-
-        return False
+        return await self._write_attribute(polling_override, _U8(override))
+
+
+async def connect_many(targets: Sequence[str], timeout: float = 5.0, **kwargs: Any) -> List[Optional[SK8]]:
+    """
+    Finds and connects to several SK8s at once.
+
+    Rather than each :meth:`SK8.connect` call running its own scan in turn, this 
+    runs a single BLE scan that stops as soon as all the targets have been seen
+    (or the timeout expires), then connects to all the devices concurrently.
+
+    Args:
+        targets (list): SK8 device names and/or addresses
+        timeout (float): scan timeout period
+        kwargs: passed to the :class:`SK8` constructor for each device
+
+    Returns:
+        a list with one entry per target, either a connected :class:`SK8` instance
+        or None if the device could not be found or connected to. A target that
+        appears more than once gets the same instance each time.
+    """
+    # only connect once to each target, preserving the caller's order
+    unique_targets = list(dict.fromkeys(targets))
+    pending = {t for t in unique_targets if t not in _device_cache}
+    all_found = asyncio.Event()
+
+    def detection_callback(device: BLEDevice, _: Any) -> None:
+        for key in (device.address, device.name):
+            if key in pending:
+                _device_cache[device.address] = device
+                if device.name is not None:
+                    _device_cache[device.name] = device
+                pending.discard(key)
+        if len(pending) == 0:
+            all_found.set()
+
+    if len(pending) > 0:
+        logger.debug('Scanning for devices %s', pending)
+        async with BleakScanner(detection_callback=detection_callback):
+            try:
+                await asyncio.wait_for(all_found.wait(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning('Failed to find target devices %s', pending)
+
+    async def _connect(target: str) -> Optional[SK8]:
+        if target not in _device_cache:
+            return None
 
+        # connect by address if that's what the target matched, so that a retry
+        # after a stale cache entry scans for the right thing
+        sk8 = SK8(**kwargs)
+        try:
+            if _device_cache[target].address == target:
+                connected = await sk8.connect(None, address=target)
+            else:
+                connected = await sk8.connect(target)
+            if connected:
+                return sk8
+        except Exception as e:
+            logger.error('Failed to connect to %s: %s', target, e)
+
+        # don't let a failed cleanup stop the other connections being returned
+        try:
+            await sk8.disconnect()
+        except Exception as e:
+            logger.debug('Failed to disconnect from %s: %s', target, e)
+        return None
+
+    sk8s = await asyncio.gather(*[_connect(t) for t in unique_targets])
+    results = dict(zip(unique_targets, sk8s, strict=True))
+    return [results[t] for t in targets]
@@ -10,6 +10,8 @@ class ExtAnaData(object):
         timestamp (float): value of `time.time()` when packet received
     """
 
+    __slots__ = ('ch1', 'ch2', 'temp', 'seq', 'timestamp')
+
     def __init__(self) -> None:
         self.ch1 = 0
         self.ch2 = 0
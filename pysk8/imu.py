@@ -1,4 +1,5 @@
 import time
+from collections import deque
 from typing import Optional, Any, Tuple, Sequence
 
 class IMUData:
@@ -9,42 +10,58 @@ class IMUData:
         acc (list): latest accelerometer readings, [x, y, z]
         mag (list): latest magnetometer readings, [x, y, z]
         acc (list): latest gyroscope readings, [x, y, z]
-        seq (int): sequence number from most recent packet (0-255 range)
+        seq (int): sequence number from most recent packet (0-255 range, -1 before the first packet)
         timestamp (float): value of `time.time()` when packet received
     """
 
     PACKET_PERIOD = 3
 
+    __slots__ = ('index', 'acc', 'mag', 'gyro', 'acc_scale', 'acc_offsets', 'gyro_offsets', 
+                 'mag_scale', 'mag_offsets', '_acc_cal', '_mag_cal', 'seq', 'timestamp', '_use_calibration', 
+                 'has_acc_calib', 'has_mag_calib', 'has_gyro_calib', '_packet_timestamps', '_packet_dropped', 
+                 '_packet_start', '_packets_lost', '_packets_lost_window')
+
     def __init__(self, index: int, calibration_data: Optional[dict[str, Any]] = None):
-        self._calibration_data = calibration_data
         self.index = index
+        # calibration state is set up once here rather than in reset(), so that it
+        # (and whether it's enabled) persists when streaming is stopped
+        self.acc_scale = (1., 1., 1.)
+        self.acc_offsets = ( 0, 0, 0 )
+        self.gyro_offsets = ( 0, 0, 0 )
+        self.mag_scale = (1., 1., 1.)
+        self.mag_offsets = ( 0, 0, 0 )
+        self._acc_cal = self.acc_scale + self.acc_offsets
+        self._mag_cal = self.mag_scale + self.mag_offsets
+        self._use_calibration = False
+        self.has_acc_calib, self.has_mag_calib, self.has_gyro_calib = False, False, False
+        self.load_calibration(calibration_data)
         self.reset()
 
     def reset(self):
         self.acc = ( 0., 0., 0. )
         self.mag = ( 0, 0, 0 )
         self.gyro = ( 0, 0, 0 )
-        self.acc_scale = (1., 1., 1.)
-        self.acc_offsets = ( 0, 0, 0 )
-        self.seq = 0
-        self._use_calibration = False
-        self._has_acc_calib, self.has_mag_calib, self.has_gyro_calib = False, False, False
-        self.load_calibration(self._calibration_data)
-        self._packet_metadata = []
-        self._packet_start = time.time()
+        self.seq = -1
+        self.timestamp = 0.
+        # timestamps and dropped packet counts for the last PACKET_PERIOD seconds,
+        # oldest first, kept as separate columns
+        self._packet_timestamps: deque[float] = deque()
+        self._packet_dropped: deque[int] = deque()
+        self._packets_lost_window = 0
+        self._packet_start = time.monotonic()
         self._packets_lost = 0
 
     def get_sample_rate(self) -> float:
-        if time.time() - self._packet_start < IMUData.PACKET_PERIOD:
+        if time.monotonic() - self._packet_start < IMUData.PACKET_PERIOD:
             return -1
-        return len(self._packet_metadata) / IMUData.PACKET_PERIOD
+        return len(self._packet_timestamps) / IMUData.PACKET_PERIOD
 
     def get_packets_lost(self) -> int:
         sample_rate = self.get_sample_rate()
         if sample_rate == -1:
             return -1
 
-        return sum([x[1] for x in self._packet_metadata])
+        return self._packets_lost_window
 
     def get_total_packets_lost(self) -> int:
         return self._packets_lost 
@@ -56,63 +73,79 @@ class IMUData:
         return self._use_calibration
 
     def load_calibration(self, calibration_data: Optional[dict[str, Any]]) -> bool:
-        axes = ['x', 'y', 'z']
         if calibration_data is None:
             return False
 
         if 'accx_offset' in calibration_data:
-            self.acc_scale = tuple(map(float, [calibration_data[f'acc{x}_scale'] for x in axes]))
-            self.acc_offsets = tuple(map(float, [calibration_data[f'acc{x}_offset'] for x in axes]))
+            self.acc_scale = (float(calibration_data['accx_scale']),
+                              float(calibration_data['accy_scale']),
+                              float(calibration_data['accz_scale']))
+            self.acc_offsets = (float(calibration_data['accx_offset']),
+                                float(calibration_data['accy_offset']),
+                                float(calibration_data['accz_offset']))
             self.has_acc_calib = True
         else:
             self.acc_scale = ( 1., 1., 1.)
             self.acc_offsets = ( 0, 0, 0 )
             
         if 'gyrox_offset' in calibration_data:
-            self.gyro_offsets = tuple(map(float, [calibration_data[f'gyro{x}_offset'] for x in axes]))
+            self.gyro_offsets = (float(calibration_data['gyrox_offset']),
+                                 float(calibration_data['gyroy_offset']),
+                                 float(calibration_data['gyroz_offset']))
             self.has_gyro_calib = True
         else:
             self.gyro_offsets = ( 0, 0, 0 )
 
         if 'magx_offset' in calibration_data:
-            self.mag_scale = tuple(map(float, [calibration_data[f'mag{x}_scale'] for x in axes]))
-            self.mag_offsets = tuple(map(float, [calibration_data[f'mag{x}_offset'] for x in axes]))
+            self.mag_scale = (float(calibration_data['magx_scale']),
+                              float(calibration_data['magy_scale']),
+                              float(calibration_data['magz_scale']))
+            self.mag_offsets = (float(calibration_data['magx_offset']),
+                                float(calibration_data['magy_offset']),
+                                float(calibration_data['magz_offset']))
             self.has_mag_calib = True
         else:
-            self.mag_offsets = ( 1., 1., 1. )
-            self.mag_scale = ( 0, 0, 0 )
+            self.mag_scale = ( 1., 1., 1. )
+            self.mag_offsets = ( 0, 0, 0 )
 
+        # (scale x, y, z, offset x, y, z) for each sensor, unpacked in one go by update()
+        self._acc_cal = self.acc_scale + self.acc_offsets
+        self._mag_cal = self.mag_scale + self.mag_offsets
         self._use_calibration = True
         return True
 
-    def _get_cal(self, raw: Sequence[float], offset: Sequence[float], scale: Sequence[float], ignore_cal: bool = False) -> Sequence[float]:
-        if ignore_cal:
-            return raw
-
-        return tuple((raw[x] * scale[x]) - offset[x] for x in range(len(raw)))
-
     def update(self, acc: Sequence[float], gyro: Sequence[float], mag: Sequence[float], seq: int, timestamp: float) -> None:
         if not self._use_calibration:
             self.acc = acc
             self.gyro = gyro
             self.mag = mag
         else:
-            self.acc = tuple(map(int, self._get_cal(acc, self.acc_offsets, self.acc_scale)))
-            self.gyro = self._get_cal(gyro, self.gyro_offsets, (1., 1., 1.))
-            self.mag = tuple(map(int, self._get_cal(mag, self.mag_offsets, self.mag_scale)))
+            # this runs for every packet, so the per-axis calculations are written out 
+            sx, sy, sz, ox, oy, oz = self._acc_cal
+            self.acc = (int(acc[0] * sx - ox), int(acc[1] * sy - oy), int(acc[2] * sz - oz))
+            ox, oy, oz = self.gyro_offsets
+            self.gyro = (gyro[0] - ox, gyro[1] - oy, gyro[2] - oz)
+            sx, sy, sz, ox, oy, oz = self._mag_cal
+            self.mag = (int(mag[0] * sx - ox), int(mag[1] * sy - oy), int(mag[2] * sz - oz))
         
+        # sequence numbers wrap at 256, so the gap since the last packet is mod 256
+        last_seq = self.seq
         dropped = 0
-        if self.seq != -1:
-            expected = (self.seq + 1) % 256
-            if expected != seq:
-                dropped = (expected - seq) % 256
-                self._packets_lost += dropped
+        if last_seq != -1:
+            dropped = (seq - last_seq - 1) & 0xFF
+            self._packets_lost += dropped
         self.seq = seq
         self.timestamp = timestamp
-        self._packet_metadata.insert(0, (timestamp, dropped))
-        now = time.time()
-        while now - self._packet_metadata[-1][0] > IMUData.PACKET_PERIOD:
-            self._packet_metadata.pop()
+        timestamps, dropped_counts = self._packet_timestamps, self._packet_dropped
+        timestamps.append(timestamp)
+        dropped_counts.append(dropped)
+        # running total of the dropped column, so get_packets_lost doesn't re-sum it
+        self._packets_lost_window += dropped
+        # the packet was just received, so its timestamp stands in for the current time
+        expiry = timestamp - IMUData.PACKET_PERIOD
+        while len(timestamps) > 0 and timestamps[0] < expiry:
+            timestamps.popleft()
+            self._packets_lost_window -= dropped_counts.popleft()
 
     def __repr__(self):
         return f'[{self.index}] acc={self.acc}, mag={self.mag}, gyro={self.gyro}, seq={self.seq}'
@@ -0,0 +1,43 @@
+"""
+Helpers for running a series of operations on a single SK8 connection.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Sequence
+
+from .core import SK8
+
+logger = logging.getLogger(__name__)
+
+# signature expected for commands passed to run_commands
+Command = Callable[[SK8], Awaitable[Any]]
+
+async def run_commands(device_name: str, commands: Sequence[Command], timeout: float = 3.0) -> bool:
+    """
+    Connect to an SK8 and run a sequence of commands using the same connection.
+
+    This avoids the cost of scanning for and connecting to the device again
+    for each operation. Each command is a coroutine function which takes the 
+    connected :class:`pysk8.core.SK8` instance as its only parameter, and the 
+    commands are awaited in the order given. 
+
+    The connection is closed when the last command completes, or if the task 
+    running this method is cancelled (e.g. by `asyncio.run` on Ctrl-C).
+
+    Args:
+        device_name (str): name of the SK8 to connect to
+        commands (list): the commands to run
+        timeout (float): scan timeout period
+
+    Returns:
+        True if all the commands were run, False if the connection failed.
+    """
+    async with SK8() as sk8: # this will disconnect any active connections when it goes out of scope
+        if not await sk8.connect(device_name, timeout=timeout):
+            logger.error('Failed to connect to device %s', device_name)
+            return False
+
+        for command in commands:
+            await command(sk8)
+
+    return True